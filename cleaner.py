@@ -1,32 +1,37 @@
-import re
-import os
+import string
+from pathlib import Path
 
 INPUT_FILE = "preproinsulin_seq.txt"
 OUTPUT_FILE = "data/preproinsulin_seq_clean.txt"
 
+# bytes.translate tables: fold A-Z to a-z and delete every non-letter byte
+_LOWERCASE = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+_NON_LETTERS = bytes(c for c in range(256) if chr(c) not in string.ascii_letters)
+
 def clean_sequence(input_file: str, output_file: str, expected_length: int | None = None) -> str:
     """
     Clean a protein sequence file in NCBI ORIGIN format.
-    - Removes 'ORIGIN', '//', digits, whitespace and non-letter chars.
+    - Discards anything before the 'ORIGIN' header, then removes '//',
+      digits, whitespace and non-letter chars.
     - Returns the cleaned sequence as a string (lowercase).
     """
-    with open(input_file, "r") as f:
-        data = f.read()
-
-    # Remove ORIGIN and end marker
-    data = data.replace("ORIGIN", "").replace("//", "")
-
-    # Remove numbers and whitespace (spaces, tabs, newlines)
-    data = re.sub(r"[0-9\s]", "", data)
-
-    # Keep only letters, convert to lowercase
-    clean_seq = re.sub(r"[^a-zA-Z]", "", data).lower()
-
-    # Create data directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
-    with open(output_file, "w") as f:
-        f.write(clean_seq)
+    # Read raw bytes: the file is never decoded to str before filtering
+    data = Path(input_file).read_bytes()
+
+    # Drop everything up to and including the ORIGIN header (if present)
+    _, marker, after = data.partition(b"ORIGIN")
+    if marker:
+        data = after
+
+    # Keep only letters (drops digits, whitespace, the // end marker,
+    # punctuation and any non-ASCII byte) and lowercase them, in a single pass
+    clean_bytes = data.translate(_LOWERCASE, _NON_LETTERS)
+    clean_seq = clean_bytes.decode("ascii")
+
+    # Create the output directory if it doesn't exist, then write the raw bytes
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(clean_bytes)
 
     print(f"Clean file created: {output_file}")
     print(f"Final length: {len(clean_seq)} characters")
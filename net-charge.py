@@ -18,10 +18,12 @@
 # cInsulin = "rreaedlqvgqvelgggpgagslqplalegslqkr"  
 # insulin = bInsulin + aInsulin  # Combine B-chain + A-chain to form the insulin protein:
 
+from collections.abc import Iterable
+from pathlib import Path
+
 def read_file(path: str) -> str:
     """Read a sequence file and return the stripped string."""
-    with open(path) as f:
-        return f.read().strip()
+    return Path(path).read_bytes().strip().decode("ascii")
     
 preproInsulin = read_file("data/preproinsulin_seq_clean.txt")
 lsInsulin = read_file("data/lsinsulin_seq_clean.txt")
@@ -41,14 +43,13 @@ pKR = {
     'd': 3.65,
     'e': 4.25
 }
- 
-# Count how many of each charge-contributing amino acid are present
-float(insulin.count("Y"))
 
-seqCount = ({x: float(insulin.count(x)) for x in ['y','c','k','h','r','d','e']})
+# Charge-contributing residues, built once and reused below
+positiveResidues = ('k', 'h', 'r')
+negativeResidues = ('y', 'c', 'd', 'e')
  
-# Calculate net charge for pH values from 0 to 14 using a loop
-pH = 0
+# Count how many of each charge-contributing amino acid are present
+seqCount = ({x: float(insulin.count(x)) for x in pKR})
  
 # # while (pH <= 14):
 # #     netCharge = (
@@ -61,30 +62,42 @@ pH = 0
 # #     pH +=1
 
 
-# Print formatted pH and charge
-print(f"{'pH':<6} | {'net-charge':>12}")
-print("-" * 22)
+# 10**pKa does not depend on pH, so compute it once per residue
+tenPKR = {x: 10.0 ** pKR[x] for x in pKR}
 
-while (pH <= 14):
 
-    # Positive charge contributors: K, H, R
-    positive = sum({
-        x: ((seqCount[x] * (10 ** pKR[x])) / ((10 ** pH) + (10 ** pKR[x])))
-        for x in ['k', 'h', 'r']
-    }.values())
+def net_charge_curve(counts: dict[str, float], phGrid: Iterable[float]) -> list[float]:
+    """
+    Return the net charge at each pH for the given charged-residue counts.
+    Uses the module-level tenPKR, positiveResidues and negativeResidues tables.
+    """
+    charges = []
 
+    # (count, 10**pKa) pairs, built once so the pH loop does no dict lookups
+    # Positive charge contributors: K, H, R
+    positivePairs = tuple((counts[x], tenPKR[x]) for x in positiveResidues)
     # Negative charge contributors: Y, C, D, E
-    negative = sum({
-        x: ((seqCount[x] * (10 ** pH)) / ((10 ** pH) + (10 ** pKR[x])))
-        for x in ['y', 'c', 'd', 'e']
-    }.values())
+    negativePairs = tuple((counts[x], tenPKR[x]) for x in negativeResidues)
 
-    # Net charge = positive - negative
-    netCharge = positive - negative
+    for pH in phGrid:
+
+        tenPH = 10.0 ** pH
+
+        positive = sum(n * tenPK / (tenPH + tenPK) for n, tenPK in positivePairs)
+        negative = sum(n * tenPH / (tenPH + tenPK) for n, tenPK in negativePairs)
+
+        # Net charge = positive - negative
+        charges.append(positive - negative)
+
+    return charges
+
+
+# Compute the whole pH 0-14 curve first, then print it in one pass
+pHValues = list(range(0, 15))
+netCharges = net_charge_curve(seqCount, pHValues)
 
-    
-    #print('{0:.2f}'.format(pH), netCharge)
-    print(f"{pH:<6.2f} | {netCharge:>12.4f}")
 
-    # Increase pH by 1
-    pH += 1
\ No newline at end of file
+# Print formatted pH and charge as one block (one write instead of one per row)
+tableLines = [f"{'pH':<6} | {'net-charge':>12}", "-" * 22]
+tableLines += [f"{pH:<6.2f} | {netCharge:>12.4f}" for pH, netCharge in zip(pHValues, netCharges)]
+print("\n".join(tableLines))
@@ -14,45 +14,58 @@ The output is written into four separate files, maintaining consistent
 file names for downstream scripts such as string-insulin.py.
 """
 
-CLEAN_FILE = "data/preproinsulin_seq_clean.txt"
+from pathlib import Path
 
+CLEAN_FILE = "data/preproinsulin_seq_clean.txt"
 
-def split_insulin(clean_file: str = CLEAN_FILE):
-    """Read a cleaned sequence and split it into LS, B, C and A segments."""
 
-    # Read the cleaned sequence from file
-    with open(clean_file, "r") as f:
-        seq = f.read().strip()
+def segments(seq: str) -> dict[str, str]:
+    """Split a 110 aa preproinsulin sequence into LS, B, C and A segments in memory."""
 
-    print(f"Input length received: {len(seq)} amino acids")
+    # ---------------------------------------------------------
+    # Segment boundaries according to the AWS re/Start lab
+    # ---------------------------------------------------------
+    return {
+        "ls": seq[0:24],     # aa 1-24  → 24 aa
+        "b":  seq[24:54],    # aa 25-54 → 30 aa
+        "c":  seq[54:89],    # aa 55-89 → 35 aa
+        "a":  seq[89:110],   # aa 90-110 → 21 aa
+    }
+
+
+def split_insulin(clean_file: str = CLEAN_FILE, seq: str | None = None, write_files: bool = True):
+    """
+    Read a cleaned sequence and split it into LS, B, C and A segments.
+    - Pass `seq` to split an already-loaded sequence without reading clean_file.
+    - Pass write_files=False to keep the segments in memory only.
+    - Returns the segments dict, or None if the sequence is not 110 aa.
+    """
+
+    if seq is None:
+        # Read the cleaned sequence once; the cleaner only ever writes ASCII
+        seq = Path(clean_file).read_bytes().strip().decode("ascii")
+
+    # The banner is only for the file-writing run; in-memory callers stay quiet
+    if write_files:
+        print(f"Input length received: {len(seq)} amino acids")
 
     # Validate expected length for human preproinsulin
     if len(seq) != 110:
-        print("ERROR: Sequence length is NOT 110. Check your cleaned file.")
+        print(f"ERROR: Sequence length is {len(seq)}, NOT 110. Check the input sequence.")
         return
 
-    # ---------------------------------------------------------
-    # Segment boundaries according to the AWS re/Start lab
-    # ---------------------------------------------------------
-    ls_seq = seq[0:24]     # aa 1-24  → 24 aa
-    b_seq  = seq[24:54]    # aa 25-54 → 30 aa
-    c_seq  = seq[54:89]    # aa 55-89 → 35 aa
-    a_seq  = seq[89:110]   # aa 90-110 → 21 aa
+    parts = segments(seq)
+    ls_seq, b_seq, c_seq, a_seq = parts["ls"], parts["b"], parts["c"], parts["a"]
+
+    if not write_files:
+        return parts
 
     # ---------------------------------------------------------
     # Write each segment to its corresponding file
+    # (keys "ls", "b", "c", "a" give lsinsulin_..., binsulin_..., etc.)
     # ---------------------------------------------------------
-    with open("data/lsinsulin_seq_clean.txt", "w") as f:
-        f.write(ls_seq)
-
-    with open("data/binsulin_seq_clean.txt", "w") as f:
-        f.write(b_seq)
-
-    with open("data/cinsulin_seq_clean.txt", "w") as f:
-        f.write(c_seq)
-
-    with open("data/ainsulin_seq_clean.txt", "w") as f:
-        f.write(a_seq)
+    for name, segment in parts.items():
+        Path(f"data/{name}insulin_seq_clean.txt").write_text(segment)
 
     # ---------------------------------------------------------
     # Verification summary
@@ -63,6 +76,8 @@ def split_insulin(clean_file: str = CLEAN_FILE):
     print(f"cinsulin_seq_clean.txt  → {len(c_seq)} characters (expected: 35)")
     print(f"ainsulin_seq_clean.txt  → {len(a_seq)} characters (expected: 21)")
 
+    return parts
+
 
 # Auto-run when executed directly
 if __name__ == "__main__":
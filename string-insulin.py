@@ -24,10 +24,11 @@
 # # cInsulin = "rreaedlqvgqvelgggpgagslqplalegslqkr" # cInsulin stores the connecting peptide (C-peptide) sequence 
 # # insulin = bInsulin + aInsulin # Combine B-chain and A-chain to form the processed insulin molecule:
 
+from pathlib import Path
+
 def read_file(path: str) -> str:
     """Read a sequence file and return the stripped string."""
-    with open(path) as f:
-        return f.read().strip()
+    return Path(path).read_bytes().strip().decode("ascii")
 
 # Load sequences from cleaned text files   
 preproInsulin = read_file("data/preproinsulin_seq_clean.txt")
@@ -61,21 +62,21 @@ aaWeights = {
     'S': 105.09, 'T': 119.12, 'V': 117.15, 'W': 204.23, 'Y': 181.19
 }
 
-# Count how many times each amino acid appears in the insulin sequence:
-aaCountInsulin = {
-    x: float(insulin.upper().count(x))
-    for x in ['A', 'C','D', 'E', 'F', 'G', 'H', 'I', 'K', 'L',
-               'M', 'N', 'P', 'Q', 'R', 'S', 'T','V', 'W', 'Y']
-} 
-
-# Multiply count * molecular weight for each amino acid and sum it
-molecularWeightInsulin = sum(
-    {
-        x: (aaCountInsulin[x] * aaWeights[x])
-        for x in ['A', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'K', 'L',
-                  'M', 'N', 'P', 'Q', 'R','S', 'T', 'V', 'W', 'Y']
-    }.values()
-)  
+# The 20 standard amino acids, built once and reused by every loop below
+aminoAcids = ('A', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'K', 'L',
+              'M', 'N', 'P', 'Q', 'R', 'S', 'T', 'V', 'W', 'Y')
+
+def molecular_weight(seq: str) -> float:
+    """Return the rough molecular weight of a sequence (sum of residue weights)."""
+    # Count how many times each amino acid appears, then multiply count * weight and sum it
+    seqUpper = seq.upper()
+    return sum(
+        seqUpper.count(x) * aaWeights[x]
+        for x in aminoAcids
+    )
+
+
+molecularWeightInsulin = molecular_weight(insulin)
 
 print("\nThe rough molecular weight of insulin:")
 print("--------------------------------------")
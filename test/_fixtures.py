@@ -0,0 +1,26 @@
+"""
+Canonical human insulin sequences shared by the tests.
+
+Human preproinsulin (110 amino acids) and its four segments, as produced
+by cleaner.py (lowercase letters only) and split_insulin.py:
+
+  - LS_SEQ: leader/signal sequence, aa 1-24   (24 aa)
+  - B_SEQ:  B-chain,                aa 25-54  (30 aa)
+  - C_SEQ:  C-peptide,              aa 55-89  (35 aa)
+  - A_SEQ:  A-chain,                aa 90-110 (21 aa)
+
+Mature insulin is the B-chain plus the A-chain (51 aa).
+
+Import the constants in a test module with:
+    from _fixtures import B_SEQ, A_SEQ, PREPRO_SEQ
+(pytest puts the test/ directory on sys.path when it collects the tests).
+"""
+
+LS_SEQ = "malwmrllpllallalwgpdpaaa"              # 24 aa
+B_SEQ = "fvnqhlcgshlvealylvcgergffytpkt"         # 30 aa
+C_SEQ = "rreaedlqvgqvelgggpgagslqplalegslqkr"    # 35 aa
+A_SEQ = "giveqcctsicslyqlenycn"                  # 21 aa
+
+# Full preproinsulin (LS + B + C + A) and mature insulin (B + A)
+PREPRO_SEQ = LS_SEQ + B_SEQ + C_SEQ + A_SEQ      # 110 aa
+INSULIN_SEQ = B_SEQ + A_SEQ                      # 51 aa
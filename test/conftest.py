@@ -5,9 +5,11 @@ This conftest.py file is automatically loaded by pytest before running tests.
 It adjusts the Python import path to ensure that modules in the project root
 (cleaner.py, split_insulin.py, etc.) can be imported by the test files.
 
-Additionally, this file provides a fixture that cleans up any generated files
-in the project root after each test completes. This ensures tests don't pollute
-the repository with generated artifacts.
+Additionally, this file provides shared fixtures: a helper that runs the
+hyphenated scripts (string-insulin.py, net-charge.py), the real preproinsulin
+sequence, and a session-wide directory of insulin segment files. Every test
+works inside a temporary directory (tmp_path or tmp_path_factory), so no
+generated artifacts ever reach the repository.
 
 The issue: When pytest runs, it uses sys.path which may not include the
 project root directory. This causes "ModuleNotFoundError" when tests try to
@@ -18,6 +20,8 @@ which pytest loads automatically. This ensures all project modules are
 discoverable no matter how pytest is invoked.
 """
 
+import importlib.util
+import string
 import sys
 from pathlib import Path
 
@@ -35,43 +39,107 @@ if str(project_root) not in sys.path:
 
 import pytest
 
+from _fixtures import A_SEQ, B_SEQ, C_SEQ, LS_SEQ, PREPRO_SEQ
 
-@pytest.fixture(autouse=True)
-def cleanup_generated_files():
+
+@pytest.fixture(scope="session")
+def run_script():
     """
-    Automatically clean up generated sequence files after each test.
+    Execute a project script such as string-insulin.py and return it as a module.
     
-    This fixture uses autouse=True, which means it runs after every test
-    without needing to be explicitly requested in the test function.
+    The scripts have hyphens in their names (so they cannot be imported
+    normally) and do all their work at import time, reading data/ relative
+    to the current working directory. Every call therefore runs the module
+    body again against whatever files the test prepared.
     
-    Generated files that should be cleaned up (in data/ directory):
-      - data/preproinsulin_seq_clean.txt
-      - data/lsinsulin_seq_clean.txt
-      - data/binsulin_seq_clean.txt
-      - data/cinsulin_seq_clean.txt
-      - data/ainsulin_seq_clean.txt
+    Scripts are loaded with importlib's SourceFileLoader, which already
+    caches their bytecode in __pycache__ (keyed by source mtime and size).
+    The fixture only keeps one module spec per script for the session; the
+    module body runs in a fresh module on every call.
     
-    We preserve preproinsulin_seq.txt (the original input file) since it's
-    part of the project data.
+    Usage:
+        module = run_script("net-charge.py", "net_charge")
+    """
+    specs = {}
+
+    def run(script_name, module_name):
+        # Build the spec on first use only; later calls reuse it
+        spec = specs.get((script_name, module_name))
+        if spec is None:
+            spec = importlib.util.spec_from_file_location(module_name, str(project_root / script_name))
+            specs[(script_name, module_name)] = spec
+
+        # A fresh module per call, so no state leaks between tests
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return run
+
+
+# Translation tables for real_preproinsulin_seq, built once at import time
+_LOWERCASE_TABLE = bytes.maketrans(
+    string.ascii_uppercase.encode("ascii"), string.ascii_lowercase.encode("ascii")
+)
+_NON_LETTER_BYTES = bytes(c for c in range(256) if chr(c) not in string.ascii_letters)
+
+
+@pytest.fixture(scope="session")
+def real_preproinsulin_seq():
     """
-    # Yield control to the test (allow it to run)
-    yield
+    The REAL 110 aa human preproinsulin sequence from preproinsulin_seq.txt.
     
-    # After the test completes, clean up generated files
-    generated_files = [
-        project_root / "data" / "preproinsulin_seq_clean.txt",
-        project_root / "data" / "lsinsulin_seq_clean.txt",
-        project_root / "data" / "binsulin_seq_clean.txt",
-        project_root / "data" / "cinsulin_seq_clean.txt",
-        project_root / "data" / "ainsulin_seq_clean.txt",
-    ]
+    The project file is in ORIGIN format (ORIGIN header, position numbers,
+    spaces, // end marker). It is read and cleaned once per test session and
+    the lowercase letters are shared by every test that requests the fixture.
+    """
+    original_content = (project_root / "preproinsulin_seq.txt").read_bytes()
+    data = original_content.replace(b"ORIGIN", b"")
+    # One bytes.translate pass lowercases A-Z and deletes every non-letter
+    return data.translate(_LOWERCASE_TABLE, _NON_LETTER_BYTES).decode("ascii")
+
+
+@pytest.fixture(scope="session")
+def real_origin_text(real_preproinsulin_seq):
+    """
+    The real preproinsulin sequence laid out as a minimal NCBI ORIGIN block.
     
-    for file_path in generated_files:
-        # Use try/except to silently ignore files that don't exist
-        # (tests might not have generated all files)
-        try:
-            if file_path.exists():
-                file_path.unlink()  # Delete the file
-        except Exception:
-            pass  # Silently ignore any errors during cleanup
+    The letters are split into groups of 10 behind a leading position number,
+    between the ORIGIN header and the // end marker, so the text is realistic
+    input for clean_sequence(). Built once per test session.
+    """
+    # Break into groups of 10 with spaces to emulate the ORIGIN layout
+    seq = real_preproinsulin_seq
+    body = " ".join(seq[i : i + 10] for i in range(0, len(seq), 10))
+    return f"ORIGIN\n1 {body}\n//\n"
+
 
+@pytest.fixture(scope="session")
+def insulin_data_dir(tmp_path_factory):
+    """
+    A directory whose data/ folder holds the real human insulin segment files.
+    
+    The layout matches what cleaner.py and split_insulin.py produce:
+      - data/preproinsulin_seq_clean.txt (110 aa)
+      - data/lsinsulin_seq_clean.txt (24 aa)
+      - data/binsulin_seq_clean.txt (30 aa)
+      - data/cinsulin_seq_clean.txt (35 aa)
+      - data/ainsulin_seq_clean.txt (21 aa)
+    
+    The files are written once per test session (tmp_path_factory creates a
+    session-wide temporary directory). string-insulin.py and net-charge.py
+    only read them, so tests can share the directory: they just
+    monkeypatch.chdir() into it before running a script.
+    """
+    root = tmp_path_factory.mktemp("insulin")
+    data_dir = root / "data"
+    data_dir.mkdir()
+    for name, seq in (
+        ("preproinsulin", PREPRO_SEQ),
+        ("lsinsulin", LS_SEQ),
+        ("binsulin", B_SEQ),
+        ("cinsulin", C_SEQ),
+        ("ainsulin", A_SEQ),
+    ):
+        (data_dir / f"{name}_seq_clean.txt").write_bytes(seq.encode("ascii"))
+    return root
@@ -4,11 +4,13 @@ Unit tests for the cleaner module.
 This module tests the clean_sequence() function and the clean_preproinsulin() wrapper.
 The tests validate:
   1. Normal behavior with NCBI ORIGIN-format input.
-  2. Input without ORIGIN/end markers but with noise (digits, punctuation).
+  2. Edge cases (one parametrized test): input without ORIGIN/end markers but
+     with noise (digits, punctuation), empty files, files with only
+     non-letter characters.
   3. Error handling when input file does not exist.
   4. The wrapper function that uses module-level constants.
   5. Real-world case: cleaning the actual 110 amino acid preproinsulin sequence.
-  6. Edge cases: empty files, files with only non-letter characters.
+  6. GenBank metadata before the ORIGIN header is discarded.
 
 All tests use tmp_path (pytest fixture) to ensure files are created only
 inside a temporary directory and are cleaned up automatically after the test.
@@ -22,12 +24,20 @@ Key pytest fixtures used:
     constants). After the test, attributes are restored to original values.
 """
 
-import re
+import string
 from pathlib import Path
 
 import pytest
 
 from cleaner import clean_sequence, clean_preproinsulin as cleaner_main
+from _fixtures import PREPRO_SEQ
+
+# Translation table built once at import time and reused by every call to
+# _expected_clean(): it maps every non-letter character (code points 0-255)
+# to None, so str.translate() deletes them in a single C-level pass
+_DELETE_NON_LETTERS = str.maketrans(
+	"", "", "".join(chr(c) for c in range(256) if chr(c) not in string.ascii_letters)
+)
 
 
 def _expected_clean(text: str) -> str:
@@ -35,9 +45,9 @@ def _expected_clean(text: str) -> str:
 	Helper function to compute the expected cleaned sequence.
 	
 	This mimics exactly what clean_sequence() does:
-	  1. Remove the string "ORIGIN" and "//" (NCBI format markers).
-	  2. Remove all digits and whitespace (regex: [0-9\s]).
-	  3. Keep only letters (A-Z, a-z) and convert to lowercase.
+	  1. Discard everything up to and including the "ORIGIN" header.
+	  2. Keep only letters (A-Z, a-z) and convert to lowercase; this also
+	     drops digits, whitespace, punctuation and the "//" end marker.
 	
 	This helper ensures our assertions match the actual function behavior.
 	If clean_sequence() changes its logic, we update this helper and all
@@ -53,22 +63,17 @@ def _expected_clean(text: str) -> str:
 	    >>> _expected_clean("ORIGIN\n1 atg 2 cta\n//")
 	    'atgcta'
 	"""
-	# Step 1: Remove ORIGIN and end markers (// is the NCBI end-of-sequence marker)
-	# str.replace() returns a new string with all occurrences of the substring replaced.
-	# We chain two replace() calls: first remove "ORIGIN", then remove "//".
-	data = text.replace("ORIGIN", "").replace("//", "")
-	
-	# Step 2: Use regex to remove all digits and whitespace (spaces, tabs, newlines)
-	# re.sub(pattern, replacement, string) replaces all matches of pattern with replacement.
-	# [0-9\s] is a character class matching: 0-9 (any digit) or \s (any whitespace).
-	# The second argument "" means replace with nothing (delete).
-	data = re.sub(r"[0-9\s]", "", data)
+	# Step 1: Drop everything up to and including the ORIGIN header
+	# str.partition() splits at the first occurrence and returns (before, sep, after);
+	# sep is "" when ORIGIN is absent, in which case the whole text is kept.
+	# The // end marker needs no special handling: it is not a letter.
+	before, marker, after = text.partition("ORIGIN")
+	data = after if marker else text
 	
-	# Step 3: Keep only alphabetic characters and convert to lowercase
-	# [^a-zA-Z] is a negated character class: ^ means "NOT", so [^...] matches anything NOT in [...]
-	# This matches any character that is NOT a letter; we replace it with "" (delete it).
-	# .lower() converts uppercase letters to lowercase.
-	return re.sub(r"[^a-zA-Z]", "", data).lower()
+	# Step 2: Keep only alphabetic characters and convert to lowercase
+	# _DELETE_NON_LETTERS deletes any character that is NOT a letter (digits, whitespace
+	# and punctuation included). .lower() converts uppercase letters to lowercase.
+	return data.translate(_DELETE_NON_LETTERS).lower()
 
 
 def test_clean_sequence_nominal_origin_format(tmp_path):
@@ -103,9 +108,10 @@ def test_clean_sequence_nominal_origin_format(tmp_path):
 	out = tmp_path / "out_clean.txt"
 	
 	# Step 3: Write the input file to the temp directory
-	# .write_text() is a pathlib.Path method that writes a string to a file.
+	# .write_bytes() is a pathlib.Path method that writes raw bytes to a file.
 	# It creates the file if it doesn't exist; overwrites if it does.
-	inp.write_text(content)
+	# Sequence data is plain ASCII, so we encode once and skip the text layer.
+	inp.write_bytes(content.encode("ascii"))
 
 	# Step 4: Compute the expected result using our helper
 	# The expected output will be "atgctaggg" (all lowercase, no numbers/spaces/special chars)
@@ -130,51 +136,55 @@ def test_clean_sequence_nominal_origin_format(tmp_path):
 	
 	# Assert 4: The file content matches the returned value
 	# This verifies the function wrote to the file correctly (not just returned the value).
-	# .read_text() reads the entire file as a string.
-	assert out.read_text() == expected, "Output file content does not match expected"
-
-
-def test_clean_sequence_no_origin_labels(tmp_path):
+	# .read_bytes() reads the entire file as raw bytes; we compare with the
+	# ASCII-encoded expected string.
+	assert out.read_bytes() == expected.encode("ascii"), "Output file content does not match expected"
+
+
+@pytest.mark.parametrize(
+	"content, expected",
+	[
+		# Noise without ORIGIN/end markers: only the letters survive
+		pytest.param("abc123 xy!z-.,_ 987", "abcxyz", id="no_origin_labels"),
+		# Empty file: nothing to clean
+		pytest.param("", "", id="empty_file"),
+		# No letters at all: everything is removed
+		pytest.param("123 456 !@# $%^ &*( )", "", id="only_numbers_and_symbols"),
+	],
+)
+def test_clean_sequence_edge_cases(tmp_path, content, expected):
 	"""
-	Test case: Input without ORIGIN markers but with noise (numbers, symbols).
+	Edge case tests: inputs that do not follow the NCBI ORIGIN format.
+	
+	This tests the cleaner's robustness to input without ORIGIN markers,
+	empty files and files with no valid characters at all.
 	
-	This tests the cleaner's robustness to input that doesn't follow the
-	exact NCBI format but still contains unwanted characters (punctuation,
-	digits, mixed case, etc.).
+	@pytest.mark.parametrize runs this single test function once per
+	pytest.param(...) entry, passing its values as `content` and `expected`.
+	The id= gives each run a readable name in the pytest output, e.g.
+	test_clean_sequence_edge_cases[empty_file].
 	
 	Expected behavior:
 	  - The function should silently handle the missing markers (no error).
 	  - All non-letter characters should be removed.
-	  - Output should be clean lowercase letters.
+	  - Output should be clean lowercase letters (possibly an empty string).
+	  - The output file should exist even when the result is empty.
 	"""
-	# Step 1: Create input with no ORIGIN/end markers but lots of noise
-	# This simulates a user providing a messy sequence file.
-	content = "abc123 xy!z-.,_ 987"
-	
-	# Step 2: Create temp file paths
-	inp = tmp_path / "in_simple.txt"
-	out = tmp_path / "out_simple.txt"
-	
-	# Step 3: Write noisy input to temp file
-	inp.write_text(content)
-
-	# Step 4: Calculate expected result
-	# Input: "abc123 xy!z-.,_ 987"
-	# Remove digits and spaces: "abcxyz"
-	# Remove non-letters: "abcxyz" (no change, all are letters)
-	# Lowercase: "abcxyz"
-	# Note: there are no ORIGIN or // to remove, but the function handles that fine.
-	expected = _expected_clean(content)
+	# Step 1: Create temp file paths and write the input
+	inp = tmp_path / "in_edge.txt"
+	out = tmp_path / "out_edge.txt"
+	inp.write_bytes(content.encode("ascii"))
 
-	# Step 5: Call clean_sequence
+	# Step 2: Our helper must agree with the hand-written expectation
+	assert _expected_clean(content) == expected, "Helper should mirror clean_sequence"
+
+	# Step 3: Call clean_sequence
 	result = clean_sequence(str(inp), str(out))
 
-	# Step 6: Verify the function handled this format correctly
-	# The function should not fail even though the input lacks ORIGIN markers.
-	assert result == expected, "Failed to clean sequence without ORIGIN markers"
-	
-	# Assert: File content is clean
-	assert out.read_text() == expected, "Output file does not match expected for non-ORIGIN input"
+	# Step 4: Verify the returned value and the written file
+	assert result == expected, f"Expected {expected!r}, got {result!r}"
+	assert out.exists(), "Output file should be created even for empty results"
+	assert out.read_bytes() == expected.encode("ascii"), "Output file does not match expected"
 
 
 def test_clean_sequence_file_not_found_raises():
@@ -236,7 +246,10 @@ def test_clean_preproinsulin_uses_constants_and_writes(tmp_path, monkeypatch):
 	content = "ORIGIN\n1 a t g c 2 g a\n//\n"
 	
 	# Step 3: Write the input file to our temp directory
-	input_path.write_text(content)
+	input_path.write_bytes(content.encode("ascii"))
+
+	# Compute the expected cleaned sequence once, before running the wrapper
+	expected = _expected_clean(content)
 
 	# Step 4: Use monkeypatch to temporarily override the module constants
 	# monkeypatch.setattr() replaces a module attribute for the duration of the test.
@@ -257,8 +270,7 @@ def test_clean_preproinsulin_uses_constants_and_writes(tmp_path, monkeypatch):
 	assert output_path.exists(), "Wrapper did not create output file"
 	
 	# Assert 2: The output file contains the expected cleaned sequence
-	# We calculate the expected value and compare.
-	assert output_path.read_text() == _expected_clean(content), "Output content is incorrect"
+	assert output_path.read_bytes() == expected.encode("ascii"), "Output content is incorrect"
 
 
 def test_clean_sequence_with_real_preproinsulin_data(tmp_path):
@@ -285,30 +297,23 @@ def test_clean_sequence_with_real_preproinsulin_data(tmp_path):
 	# Step 1: Real human preproinsulin sequence (110 amino acids)
 	# This is the actual sequence from standard biological databases.
 	# Format: single-letter amino acid codes (m=methionine, a=alanine, etc.)
-	real_seq = (
-		"malwmrllpllallalwgpdpaaafvnqhlcgshlvealylvcgergffytpktr"
-		"reaedlqvgqvelgggpgagslqplalegslqkrgiveqcctsicslyqlenycn"
-	)
+	real_seq = PREPRO_SEQ
 	
 	# Step 2: Format the real sequence as if it came from NCBI
 	# NCBI ORIGIN format: groups of 60 characters per line, position numbers
 	# We'll simulate this format to test real-world input.
-	formatted_lines = []
-	for i, char in enumerate(real_seq, 1):
-		# Every 60 characters, add a new line with position number
-		if (i - 1) % 60 == 0:
-			formatted_lines.append(f"{i:>5} ")
-		formatted_lines.append(char)
-		if i % 60 == 0:
-			formatted_lines.append("\n")
+	# Slice the sequence into 60-character chunks (one per line) and prefix
+	# each line with the position of its first residue (1, 61, ...)
+	chunks = [real_seq[i : i + 60] for i in range(0, len(real_seq), 60)]
+	body = "\n".join(f"{1 + 60 * i:>5} {chunk}" for i, chunk in enumerate(chunks))
 	
 	# Create the complete ORIGIN-formatted string
-	origin_formatted = "ORIGIN\n" + "".join(formatted_lines) + "\n//\n"
+	origin_formatted = f"ORIGIN\n{body}\n//\n"
 	
 	# Step 3: Create temp file
 	inp = tmp_path / "real_prepro.txt"
 	out = tmp_path / "real_prepro_clean.txt"
-	inp.write_text(origin_formatted)
+	inp.write_bytes(origin_formatted.encode("ascii"))
 	
 	# Step 4: Clean the real sequence
 	result = clean_sequence(str(inp), str(out))
@@ -323,62 +328,59 @@ def test_clean_sequence_with_real_preproinsulin_data(tmp_path):
 	assert len(result) == 110, f"Cleaned sequence has {len(result)} aa, expected 110"
 	
 	# The output file should match
-	assert out.read_text() == real_seq.lower(), "Output file does not match expected real sequence"
+	assert out.read_bytes() == real_seq.lower().encode("ascii"), "Output file does not match expected real sequence"
 
 
-def test_clean_sequence_empty_file(tmp_path):
+def test_clean_sequence_discards_header_before_origin(tmp_path):
 	"""
-	Edge case test: Empty or whitespace-only input file.
+	Test case: A full GenBank-style record with metadata before ORIGIN.
 	
-	Validates robustness: the cleaner should handle edge cases gracefully
-	without crashes or unexpected behavior.
+	Records downloaded from NCBI start with LOCUS/DEFINITION/FEATURES lines
+	whose letters are not part of the sequence. Everything up to and
+	including the ORIGIN header must be discarded.
 	
 	Expected behavior:
-	  - An empty file should result in an empty cleaned sequence.
-	  - No errors should be raised.
-	  - The output file should exist but be empty.
+	  - Only the letters after ORIGIN appear in the cleaned sequence.
+	  - The // end marker is removed.
 	"""
-	# Step 1: Create an empty file
-	inp = tmp_path / "empty.txt"
-	out = tmp_path / "empty_clean.txt"
-	inp.write_text("")
-	
-	# Step 2: Call clean_sequence on empty input
+	# Step 1: Create a record with a metadata header before ORIGIN
+	content = """LOCUS       AAA59172     110 aa
+DEFINITION  insulin [Homo sapiens].
+ORIGIN
+        1 malwmrllpl
+//
+"""
+	inp = tmp_path / "record.txt"
+	out = tmp_path / "record_clean.txt"
+	inp.write_bytes(content.encode("ascii"))
+
+	# Step 2: Clean the record
 	result = clean_sequence(str(inp), str(out))
-	
-	# Step 3: Verify behavior
-	# Empty input should produce empty output (no error, no crash)
-	assert result == "", "Empty file should produce empty result"
-	
-	# The output file should exist and be empty
-	assert out.exists(), "Output file should be created even for empty input"
-	assert out.read_text() == "", "Output file should be empty for empty input"
+
+	# Step 3: Verify only the sequence letters survive
+	assert result == "malwmrllpl", f"Header letters should be discarded, got {result}"
+	assert result == _expected_clean(content), "Helper should mirror clean_sequence"
+	assert out.read_bytes() == b"malwmrllpl", "Output file should contain only the sequence"
 
 
-def test_clean_sequence_only_numbers_and_symbols(tmp_path):
+def test_clean_sequence_output_without_directory(tmp_path, monkeypatch):
 	"""
-	Edge case test: Input containing only numbers and symbols (no letters).
+	Edge case test: Output path is a bare file name (no directory part).
 	
-	Validates robustness: what happens when the input has no valid characters?
+	The output directory is created before writing; for a bare file name
+	the parent is the current directory, which must not cause an error.
 	
 	Expected behavior:
-	  - All characters should be removed during cleaning.
-	  - Result should be an empty string.
-	  - No error should be raised.
-	  - The output file should exist but be empty.
+	  - The output file is written in the current working directory.
 	"""
-	# Step 1: Create input with no letters, only noise
-	content = "123 456 !@# $%^ &*( )"
-	inp = tmp_path / "no_letters.txt"
-	out = tmp_path / "no_letters_clean.txt"
-	inp.write_text(content)
-	
-	# Step 2: Clean the input
-	result = clean_sequence(str(inp), str(out))
-	
-	# Step 3: Verify behavior
-	# After removing all non-letters, the result should be empty
-	assert result == "", "Input with no letters should produce empty result"
-	
-	# The output file should be empty
-	assert out.read_text() == "", "Output file should be empty for input with no letters"
+	# Step 1: Create input and move into tmp_path
+	inp = tmp_path / "in.txt"
+	inp.write_bytes(b"ORIGIN\n1 acdef\n//\n")
+	monkeypatch.chdir(tmp_path)
+
+	# Step 2: Clean into a bare file name
+	result = clean_sequence(str(inp), "bare_clean.txt")
+
+	# Step 3: Verify the file landed in the working directory
+	assert result == "acdef"
+	assert (tmp_path / "bare_clean.txt").read_bytes() == b"acdef"
@@ -25,37 +25,14 @@ so that all relative file operations (like open("filename.txt")) happen
 inside tmp_path, not in the repository root.
 """
 
-import importlib.util
-from pathlib import Path
-
 from cleaner import clean_sequence
 import split_insulin
+from _fixtures import PREPRO_SEQ
 
 
-def _make_origin_content(seq_letters: str) -> str:
-	"""
-	Create a minimal NCBI ORIGIN-like block for given letters.
-
-	The real `clean_sequence` implementation removes the string "ORIGIN",
-	the end marker "//", any digits and whitespace and any non-letter
-	characters. To make a realistic input we place the sequence letters
-	separated into groups and include a leading numeric position. The
-	returned string is written directly to a file and later cleaned by
-	`clean_sequence`.
-	
-	Args:
-	    seq_letters: String of only letters (a-z, A-Z) to be formatted.
-	
-	Returns:
-	    String in NCBI ORIGIN format with markers and position numbers.
-	"""
-	# Break into groups of 10 with spaces to emulate the ORIGIN layout
-	groups = [seq_letters[i : i + 10] for i in range(0, len(seq_letters), 10)]
-	body = " ".join(groups)
-	return f"ORIGIN\n1 {body}\n//\n"
-
-
-def test_full_pipeline_with_real_preproinsulin_data(tmp_path, monkeypatch, capsys):
+def test_full_pipeline_with_real_preproinsulin_data(
+	tmp_path, monkeypatch, capsys, run_script, real_preproinsulin_seq, real_origin_text
+):
 	"""
 	End-to-end integration test using REAL human preproinsulin sequence.
 
@@ -87,28 +64,25 @@ def test_full_pipeline_with_real_preproinsulin_data(tmp_path, monkeypatch, capsy
 	# Step 1: Read the REAL preproinsulin sequence from the project data file
 	# The project includes preproinsulin_seq.txt with the real sequence in ORIGIN format.
 	# We read this to get the authentic biological data.
-	project_root = Path(__file__).resolve().parents[1]
-	original_file = project_root / "preproinsulin_seq.txt"
-	original_content = original_file.read_text()
-	
 	# Step 2: Extract just the letters from the original ORIGIN-formatted file
-	# The original file contains ORIGIN markers, position numbers, spaces, //, etc.
-	# We extract the cleaned version (110 aa) by running it through our helper.
-	import re
-	data = original_content.replace("ORIGIN", "").replace("//", "")
-	data = re.sub(r"[0-9\s]", "", data)
-	real_seq_110 = re.sub(r"[^a-zA-Z]", "", data).lower()
+	# The real_preproinsulin_seq fixture (conftest.py) does both steps once per session.
+	real_seq_110 = real_preproinsulin_seq
 	
 	# Verify we got a valid 110 aa sequence
+	# The fixture cleans with the same technique as cleaner.py, so compare it
+	# with the hard-coded canonical sequence (_fixtures.PREPRO_SEQ) as an
+	# independent oracle.
 	assert len(real_seq_110) == 110, f"Real preproinsulin should be 110 aa, got {len(real_seq_110)}"
+	assert real_seq_110 == PREPRO_SEQ, "Real file should hold the canonical human preproinsulin"
 	
 	# Step 3: Create a formatted ORIGIN input using the real sequence
 	# This simulates what we'd receive if downloading from NCBI.
-	origin_text = _make_origin_content(real_seq_110)
+	# The real_origin_text fixture (conftest.py) builds this text once per session.
+	origin_text = real_origin_text
 	
 	# Step 4: Create the input file in tmp_path (NOT in repo root)
 	input_file = tmp_path / "preproinsulin_seq.txt"
-	input_file.write_text(origin_text)
+	input_file.write_bytes(origin_text.encode("ascii"))
 	
 	# Step 4.5: Create data directory in tmp_path for output files
 	data_dir = tmp_path / "data"
@@ -127,18 +101,18 @@ def test_full_pipeline_with_real_preproinsulin_data(tmp_path, monkeypatch, capsy
 	# Verify the cleaned file exists and contains the expected sequence
 	cleaned_file = tmp_path / cleaned_name
 	assert cleaned_file.exists(), "Cleaned file should exist in tmp_path/data"
-	cleaned_content = cleaned_file.read_text().strip()
+	cleaned_content = cleaned_file.read_bytes().strip().decode("ascii")
 	assert len(cleaned_content) == 110, f"Cleaned sequence should be 110 aa, got {len(cleaned_content)}"
-	assert cleaned_content == real_seq_110, "Cleaned sequence should match real preproinsulin"
+	assert cleaned_content == PREPRO_SEQ, "Cleaned sequence should match real preproinsulin"
 	
 	# Step 7: Run the splitter which expects the cleaned file in the cwd/data
 	split_insulin.split_insulin()  # uses default CLEAN_FILE = "data/preproinsulin_seq_clean.txt"
 	
 	# Verify the four segment files were created in tmp_path/data with correct lengths
-	ls = (tmp_path / "data" / "lsinsulin_seq_clean.txt").read_text().strip()
-	b = (tmp_path / "data" / "binsulin_seq_clean.txt").read_text().strip()
-	c = (tmp_path / "data" / "cinsulin_seq_clean.txt").read_text().strip()
-	a = (tmp_path / "data" / "ainsulin_seq_clean.txt").read_text().strip()
+	ls = (tmp_path / "data" / "lsinsulin_seq_clean.txt").read_bytes().strip().decode("ascii")
+	b = (tmp_path / "data" / "binsulin_seq_clean.txt").read_bytes().strip().decode("ascii")
+	c = (tmp_path / "data" / "cinsulin_seq_clean.txt").read_bytes().strip().decode("ascii")
+	a = (tmp_path / "data" / "ainsulin_seq_clean.txt").read_bytes().strip().decode("ascii")
 	
 	# Verify segment lengths
 	assert len(ls) == 24, f"LS should be 24 aa, got {len(ls)}"
@@ -152,10 +126,8 @@ def test_full_pipeline_with_real_preproinsulin_data(tmp_path, monkeypatch, capsy
 	
 	# Step 8: Import string-insulin.py
 	# It reads the segment files at import time; all files are in tmp_path (current cwd).
-	string_path = project_root / "string-insulin.py"
-	spec = importlib.util.spec_from_file_location("string_insulin", str(string_path))
-	string_mod = importlib.util.module_from_spec(spec)
-	spec.loader.exec_module(string_mod)
+	# run_script (conftest.py) loads the script through importlib and runs it here.
+	string_mod = run_script("string-insulin.py", "string_insulin")
 	
 	# Verify the insulin variable (B + A)
 	expected_insulin = b + a
@@ -169,10 +141,7 @@ def test_full_pipeline_with_real_preproinsulin_data(tmp_path, monkeypatch, capsy
 	
 	# Step 9: Import net-charge.py
 	# It reads the segment files at import time; all files are in tmp_path (current cwd).
-	net_path = project_root / "net-charge.py"
-	spec2 = importlib.util.spec_from_file_location("net_charge", str(net_path))
-	net_mod = importlib.util.module_from_spec(spec2)
-	spec2.loader.exec_module(net_mod)
+	net_mod = run_script("net-charge.py", "net_charge")
 	
 	# Verify the module computed seqCount (amino acid counts)
 	assert hasattr(net_mod, "seqCount"), "Module should expose seqCount"
@@ -8,6 +8,8 @@ using runpy.run_path(), which covers the `if __name__ == "__main__":` blocks.
 import runpy
 from pathlib import Path
 
+from _fixtures import PREPRO_SEQ
+
 
 def test_cleaner_main_block(tmp_path, monkeypatch):
     """
@@ -52,16 +54,13 @@ def test_split_insulin_main_block(tmp_path, monkeypatch):
     This covers the `if __name__ == "__main__":` block in split_insulin.py (line 69).
     """
     # Step 1: Create test input (110 aa sequence)
-    seq_110 = (
-        "malwmrllpllallalwgpdpaaafvnqhlcgshlvealylvcgergffytpktr"
-        "reaedlqvgqvelgggpgagslqplalegslqkrgiveqcctsicslyqlenycn"
-    )
+    seq_110 = PREPRO_SEQ
     
     # Step 2: Create data directory with input file
     data_dir = tmp_path / "data"
     data_dir.mkdir()
     input_file = data_dir / "preproinsulin_seq_clean.txt"
-    input_file.write_text(seq_110)
+    input_file.write_bytes(seq_110.encode("ascii"))
     
     # Step 3: Change to tmp_path
     monkeypatch.chdir(tmp_path)
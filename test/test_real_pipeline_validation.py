@@ -1,15 +1,19 @@
 """
 Real pipeline validation test.
 
-This test executes the COMPLETE pipeline using the actual repository files
-and data. Unlike isolated unit tests that use tmp_path, this test:
+This test executes the COMPLETE pipeline using the actual repository input
+file and the modules' default file names. Unlike isolated unit tests that
+feed synthetic data, this test:
 
-1. Reads the real preproinsulin_seq.txt file from the repository.
-2. Executes clean_sequence() to generate data/preproinsulin_seq_clean.txt in the data/ directory.
+1. Copies the real preproinsulin_seq.txt file from the repository into tmp_path.
+2. Executes clean_preproinsulin() to generate data/preproinsulin_seq_clean.txt.
 3. Executes split_insulin.split_insulin() to generate four segment files in data/.
 4. Imports and executes string-insulin.py and net-charge.py with real files.
 5. Validates that all outputs match expected biological values.
-6. Cleans up all generated files after the test completes.
+
+The working directory is switched to tmp_path, so the default relative paths
+(preproinsulin_seq.txt, data/...) resolve there and the repository data/
+directory is never written. Pytest deletes tmp_path after the test.
 
 This test validates that the code ACTUALLY WORKS end-to-end with real data.
 It detects regressions immediately if any module is modified incorrectly.
@@ -29,35 +33,15 @@ Expected flow:
   seqCount + pH vs net-charge table
 """
 
-import importlib.util
+import re
+import shutil
 from pathlib import Path
 
-import pytest
-
 from cleaner import clean_preproinsulin
 import split_insulin
 
 
-@pytest.fixture(scope="function")
-def cleanup_real_files():
-    """
-    Cleanup fixture for real pipeline validation.
-
-    This fixture ensures that all files generated by the real pipeline
-    (not tmp_path) are deleted after the test completes, even if the
-    test fails.
-
-    The cleanup_generated_files fixture in conftest.py handles this too,
-    but this explicit fixture makes the intent clear in this specific test.
-    """
-    # Yield to allow the test to run
-    yield
-
-    # After test, cleanup is handled by conftest.py cleanup_generated_files fixture
-    # But we can add extra logging or checks here if needed
-
-
-def test_real_pipeline_end_to_end_with_actual_repo_files():
+def test_real_pipeline_end_to_end_with_actual_repo_files(tmp_path, monkeypatch, run_script):
     """
     End-to-end validation test with REAL repository files.
 
@@ -91,12 +75,17 @@ def test_real_pipeline_end_to_end_with_actual_repo_files():
     assert "ORIGIN" in original_content, "Input file should be in NCBI ORIGIN format"
     assert "//" in original_content, "Input file should end with // marker"
 
+    # Copy the real input into tmp_path and work from there, so the default
+    # relative paths used by the modules never touch the repository
+    shutil.copyfile(input_file, tmp_path / "preproinsulin_seq.txt")
+    monkeypatch.chdir(tmp_path)
+
     # Step 2: Run clean_sequence via the wrapper to generate data/preproinsulin_seq_clean.txt
-    # This creates a REAL file in the repo data/ directory (will be cleaned up by conftest.py)
+    # The file is created inside tmp_path/data (deleted by pytest after the test)
     clean_preproinsulin()
 
     # Step 3: Verify the cleaned file was created and has correct properties
-    cleaned_file = repo_root / "data" / "preproinsulin_seq_clean.txt"
+    cleaned_file = tmp_path / "data" / "preproinsulin_seq_clean.txt"
     assert cleaned_file.exists(), "data/preproinsulin_seq_clean.txt should exist after cleaning"
     cleaned_seq = cleaned_file.read_text().strip()
 
@@ -108,13 +97,13 @@ def test_real_pipeline_end_to_end_with_actual_repo_files():
     # Verify no ORIGIN markers or digits remain
     assert "ORIGIN" not in cleaned_seq, "Cleaned sequence should not contain ORIGIN"
     assert "//" not in cleaned_seq, "Cleaned sequence should not contain //"
-    assert any(c.isdigit() for c in cleaned_seq) == False, "Cleaned sequence should not contain digits"
+    assert re.search(r"\d", cleaned_seq) is None, "Cleaned sequence should not contain digits"
 
     # Step 4: Run split_insulin to generate the four segment files
     split_insulin.split_insulin()
 
     # Step 5: Verify all four segment files were created with correct content
-    data_dir = repo_root / "data"
+    data_dir = tmp_path / "data"
     ls_file = data_dir / "lsinsulin_seq_clean.txt"
     b_file = data_dir / "binsulin_seq_clean.txt"
     c_file = data_dir / "cinsulin_seq_clean.txt"
@@ -144,10 +133,8 @@ def test_real_pipeline_end_to_end_with_actual_repo_files():
     assert len(reconstructed) == 110, f"Reconstructed sequence should be 110 aa, got {len(reconstructed)}"
 
     # Step 8: Import and execute string-insulin.py with real files
-    string_path = repo_root / "string-insulin.py"
-    spec = importlib.util.spec_from_file_location("string_insulin", str(string_path))
-    string_mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(string_mod)
+    # run_script (conftest.py) loads the script through importlib and runs it here.
+    string_mod = run_script("string-insulin.py", "string_insulin")
 
     # Step 9: Validate string-insulin.py results
     # Verify insulin variable is constructed correctly (B + A chains)
@@ -171,10 +158,7 @@ def test_real_pipeline_end_to_end_with_actual_repo_files():
     assert isinstance(error_pct, float), "error_percentage should be a float"
 
     # Step 10: Import and execute net-charge.py with real files
-    net_path = repo_root / "net-charge.py"
-    spec2 = importlib.util.spec_from_file_location("net_charge", str(net_path))
-    net_mod = importlib.util.module_from_spec(spec2)
-    spec2.loader.exec_module(net_mod)
+    net_mod = run_script("net-charge.py", "net_charge")
 
     # Step 11: Validate net-charge.py results
     # Verify seqCount dictionary exists and contains amino acid counts
@@ -23,6 +23,7 @@ import importlib.util
 from pathlib import Path
 
 import split_insulin
+from _fixtures import A_SEQ, B_SEQ, INSULIN_SEQ, PREPRO_SEQ
 
 
 def test_import_split_insulin():
@@ -91,10 +92,7 @@ def test_split_insulin_splits_110_amino_acids_correctly(tmp_path, monkeypatch):
 	"""
 	# Step 1: Create a 110 amino acid test sequence
 	# Using the actual human preproinsulin sequence.
-	seq_110 = (
-		"malwmrllpllallalwgpdpaaafvnqhlcgshlvealylvcgergffytpktr"
-		"reaedlqvgqvelgggpgagslqplalegslqkrgiveqcctsicslyqlenycn"
-	)
+	seq_110 = PREPRO_SEQ
 	assert len(seq_110) == 110, "Test sequence must be exactly 110 aa"
 	
 	# Step 1.5: Create data directory in tmp_path
@@ -104,7 +102,7 @@ def test_split_insulin_splits_110_amino_acids_correctly(tmp_path, monkeypatch):
 	# Step 2: Create the input file that split_insulin expects
 	# split_insulin.py reads from "data/preproinsulin_seq_clean.txt" by default.
 	input_file = tmp_path / "data" / "preproinsulin_seq_clean.txt"
-	input_file.write_text(seq_110)
+	input_file.write_bytes(seq_110.encode("ascii"))
 	
 	# Step 3: Change the working directory to tmp_path
 	# monkeypatch.chdir(path) temporarily changes the current working directory.
@@ -206,4 +204,118 @@ def test_split_insulin_error_for_non_110_sequence(tmp_path, monkeypatch, capsys)
 	# Step 6: Verify error message was printed
 	# capsys.readouterr() captures and returns the captured stdout and stderr.
 	captured = capsys.readouterr()
-	assert "ERROR" in captured.out, "Error message should be printed for wrong length"
\ No newline at end of file
+	assert "ERROR" in captured.out, "Error message should be printed for wrong length"
+
+
+def test_segments_splits_in_memory_without_files(tmp_path, monkeypatch):
+	"""
+	Test case: segments() is the pure core of split_insulin().
+	
+	Callers that already hold the cleaned sequence in memory can split it
+	without any file I/O. Running inside an empty tmp_path proves that no
+	file is read or written.
+	
+	Expected behavior:
+	  - Returns a dict with keys "ls", "b", "c", "a".
+	  - Segment lengths are 24, 30, 35 and 21 and rebuild the input.
+	  - No files are created.
+	"""
+	# Step 1: Use the known 110 aa preproinsulin and an empty working directory
+	seq_110 = PREPRO_SEQ
+	monkeypatch.chdir(tmp_path)
+
+	# Step 2: Split the sequence in memory
+	parts = split_insulin.segments(seq_110)
+
+	# Step 3: Verify segment order, lengths and content
+	assert list(parts) == ["ls", "b", "c", "a"], "Segments should be returned in biological order"
+	assert [len(p) for p in parts.values()] == [24, 30, 35, 21], "Unexpected segment lengths"
+	assert parts["b"] == B_SEQ, "B-chain mismatch"
+	assert parts["a"] == A_SEQ, "A-chain mismatch"
+	assert "".join(parts.values()) == seq_110, "Segments should reconstruct the input"
+
+	# Step 4: Verify no file was created
+	assert list(tmp_path.iterdir()) == [], "segments() must not touch the filesystem"
+
+
+def test_split_insulin_in_memory_skips_file_io(tmp_path, monkeypatch, capsys):
+	"""
+	Test case: split_insulin() with an already-loaded sequence and no file output.
+	
+	When the caller already holds the cleaned sequence (e.g. the return value
+	of clean_sequence()), passing it as `seq` with write_files=False runs the
+	length validation and splitting without reading or writing any file.
+	
+	Expected behavior:
+	  - The segments dict is returned with str values.
+	  - No files are created in the working directory.
+	  - No "Input length received" banner is printed.
+	  - A wrong-length sequence still returns None.
+	"""
+	# Step 1: Use the known 110 aa preproinsulin and an empty working directory
+	seq_110 = PREPRO_SEQ
+	monkeypatch.chdir(tmp_path)
+
+	# Step 2: Split the loaded sequence without writing files
+	parts = split_insulin.split_insulin(seq=seq_110, write_files=False)
+
+	# Step 3: Verify the segments match the pure in-memory split
+	assert parts == split_insulin.segments(seq_110), "Should return the in-memory segments"
+	assert parts["b"] + parts["a"] == INSULIN_SEQ
+
+	# Step 4: Verify nothing was read from or written to disk
+	assert list(tmp_path.iterdir()) == [], "No files should be read or written"
+	assert capsys.readouterr().out == "", "In-memory mode should not print the banner"
+
+	# Step 5: Verify a wrong-length sequence still returns None
+	assert split_insulin.split_insulin(seq="a" * 100, write_files=False) is None
+
+
+def test_split_insulin_writes_files_from_loaded_sequence(tmp_path, monkeypatch):
+	"""
+	Test case: split_insulin() writes the segment files for a str sequence.
+	
+	Passing `seq` skips reading clean_file, but with the default
+	write_files=True the four segment files are still produced.
+	"""
+	# Step 1: Create an empty data directory and change into tmp_path
+	seq_110 = PREPRO_SEQ
+	(tmp_path / "data").mkdir()
+	monkeypatch.chdir(tmp_path)
+
+	# Step 2: Split the loaded sequence with the default write_files=True
+	split_insulin.split_insulin(seq=seq_110)
+
+	# Step 3: Verify the segment files were written without a clean_file
+	assert not (tmp_path / "data" / "preproinsulin_seq_clean.txt").exists(), "clean_file should not be needed"
+	assert (tmp_path / "data" / "ainsulin_seq_clean.txt").read_text() == seq_110[89:110]
+	assert (tmp_path / "data" / "lsinsulin_seq_clean.txt").read_text() == seq_110[0:24]
+
+
+def test_split_insulin_from_file_returns_str_segments(tmp_path, monkeypatch):
+	"""
+	Test case: split_insulin() reading clean_file returns plain str segments.
+	
+	The file is read as bytes but decoded once, so callers get the same
+	str values as from segments() and can compare or concatenate them.
+	
+	Expected behavior:
+	  - Every returned segment is a str.
+	  - The B- and A-chains equal the known insulin chains.
+	  - No segment files are written with write_files=False.
+	"""
+	# Step 1: Write the cleaned preproinsulin file into tmp_path/data
+	(tmp_path / "data").mkdir()
+	(tmp_path / "data" / "preproinsulin_seq_clean.txt").write_bytes(PREPRO_SEQ.encode("ascii"))
+	monkeypatch.chdir(tmp_path)
+
+	# Step 2: Split from the file without writing the segment files
+	parts = split_insulin.split_insulin(write_files=False)
+
+	# Step 3: Verify the segments are str and match the known chains
+	assert all(isinstance(p, str) for p in parts.values()), "Segments should be str, not bytes or memoryview"
+	assert parts["b"] == B_SEQ, "B-chain mismatch"
+	assert parts["b"] + parts["a"] == INSULIN_SEQ
+
+	# Step 4: Verify only the input file exists
+	assert [f.name for f in (tmp_path / "data").iterdir()] == ["preproinsulin_seq_clean.txt"]
@@ -26,6 +26,8 @@ Key pytest fixtures used:
 import importlib.util
 from pathlib import Path
 
+from _fixtures import A_SEQ, B_SEQ
+
 
 def test_import_string_insulin(tmp_path, monkeypatch):
     """
@@ -101,7 +103,7 @@ def test_import_string_insulin(tmp_path, monkeypatch):
     assert True, "string-insulin.py should import and execute without errors"
 
 
-def test_string_insulin_molecular_weight_calculation(tmp_path, monkeypatch, capsys):
+def test_string_insulin_molecular_weight_calculation(insulin_data_dir, monkeypatch, capsys, run_script):
     """
     Real-world test case: Verify molecular weight calculation for insulin.
     
@@ -119,49 +121,35 @@ def test_string_insulin_molecular_weight_calculation(tmp_path, monkeypatch, caps
       - Error percentage is within biological tolerance.
       - Output is printed correctly.
     """
-    # Step 0: Create data directory in tmp_path
-    data_dir = tmp_path / "data"
-    data_dir.mkdir(exist_ok=True)
-    
-    # Step 1: Create realistic test sequences
+    # Step 1: Realistic test sequences
     # These are the actual segments from human preproinsulin (110 total amino acids).
     # LS = leader/signal sequence (24 aa): "malwmrllpllallalwgpdpaaa"
     # B = B-chain of insulin (30 aa): "fvnqhlcgshlvealylvcgergffytpkt"
     # C = C-peptide (35 aa): "rreaedlqvgqvelgggpgagslqplalegslqkr"
     # A = A-chain of insulin (21 aa): "giveqcctsicslyqlenycn"
     # Mature insulin = B + A (51 aa total)
-    ls_seq = "malwmrllpllallalwgpdpaaa"          # 24 aa
-    b_seq = "fvnqhlcgshlvealylvcgergffytpkt"     # 30 aa
-    c_seq = "rreaedlqvgqvelgggpgagslqplalegslqkr"  # 35 aa
-    a_seq = "giveqcctsicslyqlenycn"              # 21 aa
-    prepro = ls_seq + b_seq + c_seq + a_seq     # 110 aa (preproinsulin)
+    # The shared constants live in test/_fixtures.py; only B and A are needed
+    # for the expected values below.
     
-    # Step 2: Create test sequence files in tmp_path/data
+    # Step 2: The insulin_data_dir fixture (conftest.py) already holds these
+    # sequences in data/*_seq_clean.txt, written once per test session.
     # string-insulin.py expects these files to exist and reads them at import time.
-    # By creating them in tmp_path/data and changing the working directory, we avoid
-    # touching the repository's real files.
-    (tmp_path / "data" / "preproinsulin_seq_clean.txt").write_text(prepro)
-    (tmp_path / "data" / "lsinsulin_seq_clean.txt").write_text(ls_seq)
-    (tmp_path / "data" / "binsulin_seq_clean.txt").write_text(b_seq)
-    (tmp_path / "data" / "ainsulin_seq_clean.txt").write_text(a_seq)
-    (tmp_path / "data" / "cinsulin_seq_clean.txt").write_text(c_seq)
-
-    # Step 3: Change working directory to tmp_path
-    # This ensures all file operations (especially open() calls) happen in the temp directory.
-    monkeypatch.chdir(tmp_path)
+    # The script only reads them, so the directory can be shared between tests.
+
+    # Step 3: Change working directory to the shared data directory
+    # This ensures all file operations (especially open() calls) happen there,
+    # not in the repository root.
+    monkeypatch.chdir(insulin_data_dir)
 
     # Step 4: Import and execute string-insulin.py
-    # The module will read the files we created in tmp_path (since that's now the cwd).
-    repo_root = Path(__file__).resolve().parents[1]
-    mod_path = repo_root / "string-insulin.py"
-    spec = importlib.util.spec_from_file_location("string_insulin", str(mod_path))
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    # The module will read the fixture's files (since that's now the cwd).
+    # run_script (conftest.py) loads the script through importlib and runs it here.
+    module = run_script("string-insulin.py", "string_insulin")
 
     # Step 5: Verify the insulin sequence (B + A)
-    # The module constructs insulin by concatenating b_seq and a_seq.
+    # The module constructs insulin by concatenating the B and A chains.
     # This is the active (mature) insulin protein used by the body.
-    expected_insulin = b_seq + a_seq
+    expected_insulin = B_SEQ + A_SEQ
     assert hasattr(module, "insulin"), "Module should expose 'insulin' variable"
     assert module.insulin == expected_insulin, f"insulin variable should be B + A chains, got {module.insulin}"
     assert len(module.insulin) == 51, "Mature insulin should be 51 aa (30 + 21)"
@@ -197,3 +185,30 @@ def test_string_insulin_molecular_weight_calculation(tmp_path, monkeypatch, caps
     # to verify the module is doing its job (not just silently computing).
     captured = capsys.readouterr()
     assert "molecular weight" in captured.out.lower(), "Module should print molecular weight information"
+
+
+def test_molecular_weight_function_is_reusable(insulin_data_dir, monkeypatch, run_script):
+    """
+    Test case: molecular_weight() can score any sequence, not just insulin.
+    
+    The function sums residue weights for an arbitrary sequence, so many
+    sequences can be scored by calling it repeatedly instead of re-running
+    the whole script.
+    
+    Expected behavior:
+      - Known residues sum to their tabulated weights.
+      - Lowercase and uppercase input give the same result.
+      - Unknown characters contribute nothing.
+    """
+    # Step 1: Load string-insulin.py from the shared read-only insulin files
+    # (only the function is used, so no files need to be created here)
+    monkeypatch.chdir(insulin_data_dir)
+    module = run_script("string-insulin.py", "string_insulin")
+
+    # Step 2: Score a few sequences
+    glycine = module.aaWeights["G"]
+    tryptophan = module.aaWeights["W"]
+    assert abs(module.molecular_weight("GGW") - (2 * glycine + tryptophan)) < 1e-9
+    assert module.molecular_weight("ggw") == module.molecular_weight("GGW"), "Scoring should be case-insensitive"
+    assert module.molecular_weight("XB*") == 0, "Unknown characters should not contribute"
+    assert module.molecular_weight(module.insulin) == module.molecularWeightInsulin